@@ -2,18 +2,24 @@
 FEEDOM - Uniswap Auto Bot Engine
 """
 
+import asyncio
+import json
 import time
 from dataclasses import dataclass
-from typing import Optional, List
-from web3 import Web3
+from typing import Any, Coroutine, Optional, List, Set
+from web3 import Web3, AsyncWeb3
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
-from rich.console import Console
+import websockets
 from rich.table import Table
 from rich.panel import Panel
 
 from .config import Config
-from .pool import UniswapV3Pool, PoolState
+from .cache import load_cache, save_cache
+from .display import console, print_logo, print_footer
+from .multicall import Multicall, batch_call
+from .pool import UniswapV3Pool, PoolState, SWAP_EVENT_TOPIC
+from .rpc import PooledHTTPProvider, PooledAsyncHTTPProvider
 from .position_manager import PositionManager, NFTPosition
 from .utils import (
     calculate_tick_range,
@@ -23,37 +29,18 @@ from .utils import (
     format_usdc,
     is_position_in_range,
     calculate_position_ratio,
+    MAX_UINT256,
 )
 
 
-console = Console()
-
-# FEEDOM ASCII Art Logo
-FEEDOM_LOGO = """
-[bold cyan]
-    ╔════════════════════════════════════════════════════════════════════╗
-    ║       ███████╗███████╗███████╗██████╗  ██████╗ ███╗   ███╗         ║
-    ║       ██╔════╝██╔════╝██╔════╝██╔══██╗██╔═══██╗████╗ ████║         ║
-    ║       █████╗  █████╗  █████╗  ██║  ██║██║   ██║██╔████╔██║         ║
-    ║       ██╔══╝  ██╔══╝  ██╔══╝  ██║  ██║██║   ██║██║╚██╔╝██║         ║
-    ║       ██║     ███████╗███████╗██████╔╝╚██████╔╝██║ ╚═╝ ██║         ║
-    ║       ╚═╝     ╚══════╝╚══════╝╚═════╝  ╚═════╝ ╚═╝     ╚═╝         ║
-    ║                                                                    ║
-    ║                    [bold yellow]🚀 UNISWAP AUTO 🚀[/bold yellow][bold cyan]                          ║
-    ║          Automated Concentrated Liquidity on Arbitrum              ║
-    ║                       [bold magenta]feedom.tech[/bold magenta][bold cyan]                               ║
-    ╚════════════════════════════════════════════════════════════════════╝
-[/bold cyan]"""
-
-
-def print_logo():
-    """Print the FEEDOM logo"""
-    console.print(FEEDOM_LOGO)
-
-
-def print_footer():
-    """Print FEEDOM footer"""
-    console.print("[dim]🚀 Powered by FEEDOM | feedom.tech[/dim]")
+@dataclass
+class StatusSnapshot:
+    """Everything one bot iteration reads from chain"""
+    pool_state: PoolState
+    position: Optional[NFTPosition]
+    weth_balance: int
+    usdc_balance: int
+    eth_balance: int
 
 
 @dataclass
@@ -63,7 +50,11 @@ class BotState:
     tick_lower: Optional[int] = None
     tick_upper: Optional[int] = None
     last_check_time: float = 0
+    last_check_tick: Optional[int] = None
     rebalance_count: int = 0
+    # Last position read from chain, and when
+    position: Optional[NFTPosition] = None
+    position_fetched_at: float = 0
 
 
 class LiquidityBot:
@@ -77,48 +68,143 @@ class LiquidityBot:
     - Collects fees periodically
     """
     
+    # Positions read per batch while looking for the active one
+    POSITION_SCAN_BATCH = 20
+    
+    # How long a cached position may stand in for a fresh read
+    POSITION_REFETCH_SECONDS = 60
+    
     def __init__(self, config: Config):
         self.config = config
         
         # Setup Web3
-        self.w3 = Web3(Web3.HTTPProvider(config.rpc_url))
+        self.w3 = Web3(PooledHTTPProvider(config.rpc_url))
         if not self.w3.is_connected():
             raise ConnectionError(f"Failed to connect to {config.rpc_url}")
         
+        # Async Web3 for concurrent reads. A single long-lived event loop keeps
+        # the provider's pooled aiohttp session (and its connections) alive
+        # between calls; close() releases both.
+        self.async_w3 = AsyncWeb3(PooledAsyncHTTPProvider(config.rpc_url))
+        self.loop = asyncio.new_event_loop()
+        
         # Setup account
         self.account: LocalAccount = Account.from_key(config.private_key)
         console.print(f"[green]Wallet:[/green] {self.account.address}")
         
         # Setup pool and position manager
-        self.pool = UniswapV3Pool(self.w3, config.pool_address)
-        self.pm = PositionManager(self.w3, config, self.account)
+        self.multicall: Optional[Multicall] = None
+        if config.multicall_address:
+            self.multicall = Multicall(self.w3, config.multicall_address)
+        self.pool = UniswapV3Pool(self.w3, config.pool_address, self.multicall)
+        
+        # Pool immutables and the active position survive restarts on disk
+        self._cache = load_cache()
+        pools = self._cache.setdefault("pools", {})
+        pools[self.pool.pool_address] = self.pool.prefetch_immutables(
+            pools.get(self.pool.pool_address)
+        )
+        self.pm = PositionManager(self.w3, config, self.account, self.async_w3, self.multicall)
         
         # Bot state
         self.state = BotState()
         
+        # Tokens known to have an effectively unlimited allowance
+        self._approved_tokens: Set[str] = set()
+        
         # Load existing positions
         self._load_existing_positions()
     
+    def run_async(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine to completion on the bot's event loop"""
+        return self.loop.run_until_complete(coro)
+    
+    def close(self):
+        """Close the async RPC session and the bot's event loop"""
+        if self.loop.is_closed():
+            return
+        self.run_async(self.async_w3.provider.close())
+        self.loop.close()
+    
+    def get_positions(self, token_ids: List[int]) -> List[NFTPosition]:
+        """Fetch several positions (one Multicall3 call, or concurrently without it)"""
+        if self.multicall is not None:
+            return self.pm.get_positions(token_ids)
+        return self.run_async(self.pm.get_positions_async(token_ids))
+    
+    def _is_active_pool_position(self, pos: NFTPosition) -> bool:
+        """Check if a position is funded and belongs to our pool"""
+        return (
+            pos.liquidity > 0 and
+            pos.fee == self.pool.fee and
+            pos.token0.lower() == self.pool.token0.lower() and
+            pos.token1.lower() == self.pool.token1.lower()
+        )
+    
+    def _find_active_position(self, token_ids: List[int]) -> Optional[NFTPosition]:
+        """Find a funded position in our pool, stopping at the first match"""
+        # Newest first: after a rebalance the bot's position is the latest mint,
+        # so the first batch almost always contains it. Each batch is one
+        # Multicall3 call (or one concurrent gather) and is checked in order,
+        # so the pick is the same on either path.
+        newest_first = token_ids[::-1]
+        for start in range(0, len(newest_first), self.POSITION_SCAN_BATCH):
+            batch = newest_first[start:start + self.POSITION_SCAN_BATCH]
+            for pos in self.get_positions(batch):
+                if self._is_active_pool_position(pos):
+                    return pos
+        return None
+    
     def _load_existing_positions(self):
         """Load any existing positions for this wallet"""
-        token_ids = self.pm.get_positions_for_owner(self.account.address)
+        balance = self.pm.balance_of(self.account.address)
+        
+        # Same NFT count as last run: trust the cached position, skip the scan
+        cached = self._position_cache().get(self.pool.pool_address)
+        if cached is not None and cached["nft_balance"] == balance:
+            self.state.active_position_id = cached["active_position_id"]
+            self.state.tick_lower = cached["tick_lower"]
+            self.state.tick_upper = cached["tick_upper"]
+            if self.state.active_position_id is not None:
+                console.print(f"[green]Using cached position #{self.state.active_position_id}[/green]")
+            return
+        
+        # balanceOf == 0 returns here without enumerating
+        token_ids = self.pm.get_positions_for_owner(self.account.address, balance)
         
         if token_ids:
             console.print(f"[yellow]Found {len(token_ids)} existing position(s)[/yellow]")
             
-            # Find positions for our pool
-            for token_id in token_ids:
-                pos = self.pm.get_position(token_id)
-                if (pos.token0.lower() == self.pool.token0.lower() and 
-                    pos.token1.lower() == self.pool.token1.lower() and
-                    pos.fee == self.pool.fee):
-                    
-                    if pos.liquidity > 0:
-                        self.state.active_position_id = token_id
-                        self.state.tick_lower = pos.tick_lower
-                        self.state.tick_upper = pos.tick_upper
-                        console.print(f"[green]Using existing position #{token_id}[/green]")
-                        break
+            pos = self._find_active_position(token_ids)
+            if pos is not None:
+                self.state.active_position_id = pos.token_id
+                self.state.tick_lower = pos.tick_lower
+                self.state.tick_upper = pos.tick_upper
+                console.print(f"[green]Using existing position #{pos.token_id}[/green]")
+        
+        self._save_cache(balance)
+    
+    def _position_cache(self) -> dict:
+        """This wallet's cached positions, keyed by pool address"""
+        return self._cache.setdefault("positions", {}).setdefault(self.account.address, {})
+    
+    def _save_cache(self, nft_balance: Optional[int] = None):
+        """Record the active position, with the NFT count it was found at, on disk"""
+        if nft_balance is None:
+            nft_balance = self.pm.balance_of(self.account.address)
+        
+        self._position_cache()[self.pool.pool_address] = {
+            "active_position_id": self.state.active_position_id,
+            "tick_lower": self.state.tick_lower,
+            "tick_upper": self.state.tick_upper,
+            "nft_balance": nft_balance,
+        }
+        
+        # The cache is only a startup shortcut; never fail the bot over it
+        try:
+            save_cache(self._cache)
+        except OSError as e:
+            console.print(f"[dim]Could not write state cache: {e}[/dim]")
     
     def get_pool_state(self) -> PoolState:
         """Get current pool state"""
@@ -128,11 +214,80 @@ class LiquidityBot:
         """Get active position if exists"""
         if self.state.active_position_id is None:
             return None
-        return self.pm.get_position(self.state.active_position_id)
+        return self._remember_position(self.pm.get_position(self.state.active_position_id))
+    
+    def _remember_position(self, position: NFTPosition) -> NFTPosition:
+        """Cache a position just read from chain"""
+        self.state.position = position
+        self.state.position_fetched_at = time.time()
+        return position
+    
+    def _cached_position(self, tick: int) -> Optional[NFTPosition]:
+        """
+        Recently read active position, if it can stand in for a fresh read
+        
+        Only used while the tick sits at least one tick spacing inside the
+        cached range, so a stale answer cannot hide an out-of-range position.
+        """
+        position = self.state.position
+        if position is None or position.token_id != self.state.active_position_id:
+            return None
+        if time.time() - self.state.position_fetched_at > self.POSITION_REFETCH_SECONDS:
+            return None
+        
+        buffer = self.pool.tick_spacing
+        if not position.tick_lower + buffer <= tick <= position.tick_upper - buffer:
+            return None
+        return position
     
-    def display_status(self):
-        """Display current bot status"""
-        pool_state = self.get_pool_state()
+    def read_snapshot(self) -> StatusSnapshot:
+        """
+        Read pool state, active position and wallet balances in a single batched call
+        
+        The positions() read is left out of the batch while the last read is
+        recent and the last checked tick sat well inside its range (see
+        _cached_position). If the fresh tick no longer does, the position is
+        read with one follow-up call.
+        """
+        position = None
+        if self.state.last_check_tick is not None:
+            position = self._cached_position(self.state.last_check_tick)
+        fetch_position = self.state.active_position_id is not None and position is None
+        
+        calls = self.pool.state_calls() + [
+            self.pool.token_balance_call(self.config.weth_address, self.account.address),
+            self.pool.token_balance_call(self.config.usdc_address, self.account.address),
+        ]
+        if fetch_position:
+            calls.append(self.pm.position_call(self.state.active_position_id))
+        if self.multicall is not None:
+            calls.append(self.multicall.get_eth_balance(self.account.address))
+        
+        results = batch_call(self.multicall, calls)
+        
+        if self.multicall is not None:
+            eth_balance = results.pop()
+        else:
+            eth_balance = self.w3.eth.get_balance(self.account.address)
+        
+        pool_state = self.pool.build_state(results[0], results[1])
+        weth_balance, usdc_balance = results[2:4]
+        if fetch_position:
+            position = self._remember_position(
+                self.pm.build_position(self.state.active_position_id, results[4])
+            )
+        elif position is not None and self._cached_position(pool_state.tick) is None:
+            # Tick moved toward the range edge since the last check
+            position = self.get_active_position()
+        
+        return StatusSnapshot(pool_state, position, weth_balance, usdc_balance, eth_balance)
+    
+    def display_status(self, snapshot: Optional[StatusSnapshot] = None):
+        """Display current bot status (reads a fresh snapshot if none is given)"""
+        if snapshot is None:
+            snapshot = self.read_snapshot()
+        pool_state = snapshot.pool_state
+        position = snapshot.position
         
         # Pool info table
         pool_table = Table(title="🚀 Pool Status", show_header=False)
@@ -149,7 +304,6 @@ class LiquidityBot:
         console.print(pool_table)
         
         # Position info
-        position = self.get_active_position()
         if position:
             pos_table = Table(title="🚀 Active Position", show_header=False)
             pos_table.add_column("Property", style="cyan")
@@ -171,38 +325,53 @@ class LiquidityBot:
             console.print("[yellow]No active position[/yellow]")
         
         # Wallet balances
-        weth_balance = self.pool.get_token_balance(self.config.weth_address, self.account.address)
-        usdc_balance = self.pool.get_token_balance(self.config.usdc_address, self.account.address)
-        eth_balance = self.w3.eth.get_balance(self.account.address)
-        
         balance_table = Table(title="🚀 Wallet Balances", show_header=False)
         balance_table.add_column("Token", style="cyan")
         balance_table.add_column("Balance", style="green")
         
-        balance_table.add_row("ETH (native)", format_eth(eth_balance))
-        balance_table.add_row("WETH", format_eth(weth_balance))
-        balance_table.add_row("USDC", format_usdc(usdc_balance))
+        balance_table.add_row("ETH (native)", format_eth(snapshot.eth_balance))
+        balance_table.add_row("WETH", format_eth(snapshot.weth_balance))
+        balance_table.add_row("USDC", format_usdc(snapshot.usdc_balance))
         
         console.print(balance_table)
         print_footer()
     
-    def needs_rebalance(self) -> bool:
-        """Check if position needs rebalancing"""
+    def needs_rebalance(
+        self,
+        pool_state: Optional[PoolState] = None,
+        position: Optional[NFTPosition] = None,
+    ) -> bool:
+        """
+        Check if position needs rebalancing
+        
+        Pass the pool state and position already read this iteration to avoid
+        re-fetching them. Otherwise the pool state is read from chain and the
+        position comes from the recent-read cache while the tick stays well
+        inside its range.
+        """
         if self.state.active_position_id is None:
             return False
         
-        pool_state = self.get_pool_state()
-        position = self.get_active_position()
+        if pool_state is None:
+            pool_state = self.get_pool_state()
+        if position is None:
+            position = self._cached_position(pool_state.tick) or self.get_active_position()
         
         if position is None or position.liquidity == 0:
             return False
         
+        # Inlined is_position_in_range / calculate_position_ratio: this runs
+        # on every check, and once in range the ratio needs no clamping
+        tick = pool_state.tick
+        tick_lower = position.tick_lower
+        tick_upper = position.tick_upper
+        
         # Check if out of range
-        if not is_position_in_range(pool_state.tick, position.tick_lower, position.tick_upper):
+        if not tick_lower <= tick < tick_upper:
             return True
         
         # Check if position ratio exceeds threshold
-        ratio = calculate_position_ratio(pool_state.tick, position.tick_lower, position.tick_upper)
+        ratio = (tick - tick_lower) / (tick_upper - tick_lower)
         threshold = self.config.rebalance_threshold_percent / 100
         
         if ratio < (1 - threshold) / 2 or ratio > (1 + threshold) / 2:
@@ -210,9 +379,10 @@ class LiquidityBot:
         
         return False
     
-    def calculate_new_range(self) -> tuple[int, int]:
+    def calculate_new_range(self, pool_state: Optional[PoolState] = None) -> tuple[int, int]:
         """Calculate new tick range centered on current price"""
-        pool_state = self.get_pool_state()
+        if pool_state is None:
+            pool_state = self.get_pool_state()
         
         return calculate_tick_range(
             pool_state.tick,
@@ -221,32 +391,55 @@ class LiquidityBot:
         )
     
     def ensure_approvals(self, amount0: int, amount1: int):
-        """Ensure token approvals for Position Manager"""
-        # Check WETH allowance
-        weth_allowance = self.pool.get_token_allowance(
-            self.config.weth_address,
-            self.account.address,
-            self.config.position_manager_address
-        )
+        """
+        Ensure token approvals for Position Manager
         
-        if weth_allowance < amount0:
-            console.print("[yellow]Approving WETH...[/yellow]")
-            tx_hash = self.pm.approve_token(self.config.weth_address, 2**256 - 1)
-            self.w3.eth.wait_for_transaction_receipt(tx_hash)
-            console.print(f"[green]WETH approved: {tx_hash}[/green]")
-        
-        # Check USDC allowance
-        usdc_allowance = self.pool.get_token_allowance(
-            self.config.usdc_address,
-            self.account.address,
-            self.config.position_manager_address
-        )
+        The bot always approves MAX_UINT256, so once a token is seen with an
+        unlimited allowance it is not read again for the life of the process.
+        """
+        tokens = [
+            (name, address, amount)
+            for name, address, amount in (
+                ("WETH", self.config.weth_address, amount0),
+                ("USDC", self.config.usdc_address, amount1),
+            )
+            if address not in self._approved_tokens
+        ]
+        if not tokens:
+            return
+        
+        # Both allowances in one round-trip
+        allowances = batch_call(self.multicall, [
+            self.pool.token_allowance_call(
+                address,
+                self.account.address,
+                self.config.position_manager_address
+            )
+            for _, address, _ in tokens
+        ])
+        
+        to_approve = []
+        for (name, address, amount), allowance in zip(tokens, allowances):
+            if allowance < amount:
+                to_approve.append((name, address))
+            elif allowance >= MAX_UINT256 // 2:
+                # Some tokens (USDC) still decrement a max allowance on use
+                self._approved_tokens.add(address)
+        
+        if not to_approve:
+            return
         
-        if usdc_allowance < amount1:
-            console.print("[yellow]Approving USDC...[/yellow]")
-            tx_hash = self.pm.approve_token(self.config.usdc_address, 2**256 - 1)
-            self.w3.eth.wait_for_transaction_receipt(tx_hash)
-            console.print(f"[green]USDC approved: {tx_hash}[/green]")
+        # Send every approval up front (the position manager hands out
+        # consecutive nonces) so they can be mined together, then wait
+        sent = []
+        for name, address in to_approve:
+            console.print(f"[yellow]Approving {name}...[/yellow]")
+            sent.append((name, address, self.pm.approve_token(address, MAX_UINT256)))
+        
+        for name, address, tx_hash in sent:
+            self.pm.wait_for_receipt(tx_hash)
+            console.print(f"[green]{name} approved: {tx_hash}[/green]")
+            self._approved_tokens.add(address)
     
     def create_position(
         self,
@@ -267,8 +460,6 @@ class LiquidityBot:
         Returns:
             Token ID of the new position
         """
-        pool_state = self.get_pool_state()
-        
         # Calculate tick range if not provided
         if tick_lower is None or tick_upper is None:
             tick_lower, tick_upper = self.calculate_new_range()
@@ -312,6 +503,7 @@ class LiquidityBot:
         self.state.active_position_id = token_id
         self.state.tick_lower = tick_lower
         self.state.tick_upper = tick_upper
+        self._save_cache()
         
         return token_id
     
@@ -323,7 +515,8 @@ class LiquidityBot:
         
         console.print("[yellow]🚀 Starting rebalance...[/yellow]")
         
-        position = self.get_active_position()
+        # Liquidity is about to change; never reuse the cached read
+        self.state.position = None
         
         # 1. Close existing position
         console.print("Closing existing position...")
@@ -345,6 +538,7 @@ class LiquidityBot:
         else:
             console.print("[red]No tokens available for new position[/red]")
             self.state.active_position_id = None
+            self._save_cache()
     
     def collect_fees(self):
         """Collect fees from active position"""
@@ -371,16 +565,65 @@ class LiquidityBot:
         console.print(f"[bold cyan]🚀 FEEDOM Check @ {time.strftime('%Y-%m-%d %H:%M:%S')}[/bold cyan]")
         console.print("=" * 60)
         
-        self.display_status()
+        # One read per iteration, shared by display and the rebalance check
+        snapshot = self.read_snapshot()
+        self.display_status(snapshot)
         
         # Check if rebalance needed
-        if self.needs_rebalance():
+        if self.needs_rebalance(snapshot.pool_state, snapshot.position):
             console.print("[yellow]Position out of optimal range - rebalancing...[/yellow]")
             self.rebalance()
         else:
             console.print("[green]🚀 Position in optimal range[/green]")
         
         self.state.last_check_time = time.time()
+        self.state.last_check_tick = snapshot.pool_state.tick
+    
+    def _check(self):
+        """Run one iteration, reporting errors instead of raising"""
+        try:
+            self.run_once()
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+    
+    async def _run_on_swaps(self):
+        """
+        Drive checks from the pool's Swap events over WebSocket
+        
+        Each Swap log carries the post-swap tick, so filtering costs no RPC.
+        A check runs once the tick has moved at least one tick spacing since
+        the last check, or after check_interval_seconds without any swap.
+        """
+        subscribe = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "eth_subscribe",
+            "params": ["logs", {"address": self.pool.pool_address, "topics": [SWAP_EVENT_TOPIC]}],
+        }
+        
+        async with websockets.connect(self.config.ws_url) as ws:
+            await ws.send(json.dumps(subscribe))
+            reply = json.loads(await ws.recv())
+            if "error" in reply:
+                raise ConnectionError(f"eth_subscribe failed: {reply['error']}")
+            console.print("[green]🚀 Subscribed to pool Swap events[/green]")
+            
+            # run_once is blocking, so it runs off the WebSocket loop
+            await asyncio.to_thread(self._check)
+            
+            while True:
+                try:
+                    message = await asyncio.wait_for(ws.recv(), self.config.check_interval_seconds)
+                except asyncio.TimeoutError:
+                    await asyncio.to_thread(self._check)
+                    continue
+                
+                tick = self.pool.parse_swap_tick(json.loads(message)["params"]["result"])
+                last_tick = self.state.last_check_tick
+                if last_tick is not None and abs(tick - last_tick) < self.pool.tick_spacing:
+                    continue
+                
+                await asyncio.to_thread(self._check)
     
     def run(self):
         """Run the bot continuously"""
@@ -398,10 +641,14 @@ class LiquidityBot:
         ))
         
         while True:
-            try:
-                self.run_once()
-            except Exception as e:
-                console.print(f"[red]Error: {e}[/red]")
+            if self.config.ws_url:
+                try:
+                    asyncio.run(self._run_on_swaps())
+                except Exception as e:
+                    console.print(f"[red]WebSocket error: {e} - polling until reconnect[/red]")
+            
+            # Polling mode, or one timer cycle before retrying the WebSocket
+            self._check()
             
             console.print(f"\n[dim]🚀 Sleeping {self.config.check_interval_seconds}s...[/dim]")
             time.sleep(self.config.check_interval_seconds)
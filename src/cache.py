@@ -0,0 +1,27 @@
+"""
+On-disk cache of chain state that survives restarts
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+from .config import STATE_CACHE_PATH
+
+
+def load_cache(path: Path = STATE_CACHE_PATH) -> Dict[str, Any]:
+    """Load the cache, or an empty one if the file is missing or unreadable"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: Dict[str, Any], path: Path = STATE_CACHE_PATH):
+    """Write the cache, replacing the old file atomically"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f, indent=2)
+    tmp_path.replace(path)
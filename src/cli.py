@@ -2,22 +2,38 @@
 FEEDOM - Uniswap Auto CLI Interface
 """
 
+import atexit
+from typing import TYPE_CHECKING
 import click
-from rich.console import Console
 from rich.panel import Panel
 
 from .config import Config
-from .bot import LiquidityBot, print_logo, print_footer
-from .utils import eth_to_wei, usdc_to_raw, format_eth, format_usdc
+from .display import console, print_logo, print_footer
+from .utils import (
+    eth_to_wei,
+    usdc_to_raw,
+    format_eth,
+    format_usdc,
+    tick_to_price,
+    is_position_in_range,
+)
 
-console = Console()
+if TYPE_CHECKING:
+    from .bot import LiquidityBot
 
 
-def get_bot() -> LiquidityBot:
+def get_bot() -> "LiquidityBot":
     """Initialize and return bot instance"""
+    # web3 dominates import time; `--help` and argument errors skip it
+    from .bot import LiquidityBot
+    
     config = Config.from_env()
     config.validate()
-    return LiquidityBot(config)
+    bot = LiquidityBot(config)
+    
+    # Release the async RPC session however the command exits
+    atexit.register(bot.close)
+    return bot
 
 
 @click.group()
@@ -163,18 +179,21 @@ def positions():
         
         pool_state = bot.get_pool_state()
         
-        for token_id in token_ids:
-            pos = bot.pm.get_position(token_id)
+        # Loop invariants
+        current_tick = pool_state.tick
+        pool_token0 = bot.pool.token0.lower()
+        pool_token1 = bot.pool.token1.lower()
+        
+        for pos in bot.get_positions(token_ids):
+            token_id = pos.token_id
             
             # Check if this is for our pool
             is_our_pool = (
-                pos.token0.lower() == bot.pool.token0.lower() and
-                pos.token1.lower() == bot.pool.token1.lower()
+                pos.token0.lower() == pool_token0 and
+                pos.token1.lower() == pool_token1
             )
             
-            from .utils import tick_to_price, is_position_in_range
-            
-            in_range = is_position_in_range(pool_state.tick, pos.tick_lower, pos.tick_upper)
+            in_range = is_position_in_range(current_tick, pos.tick_lower, pos.tick_upper)
             
             console.print(Panel(
                 f"Token ID: {token_id}\n"
@@ -2,8 +2,10 @@
 Configuration management for Uniswap V3 Liquidity Bot
 """
 
+import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -17,6 +19,7 @@ class Config:
     
     # RPC
     rpc_url: str
+    ws_url: str
     
     # Wallet
     private_key: str
@@ -31,6 +34,9 @@ class Config:
     # Position Manager
     position_manager_address: str
     
+    # Multicall3 (batched reads)
+    multicall_address: str
+    
     # Bot Settings
     tick_range: int
     check_interval_seconds: int
@@ -46,11 +52,13 @@ class Config:
         """Load configuration from environment variables"""
         return cls(
             rpc_url=os.getenv("RPC_URL", "https://arb1.arbitrum.io/rpc"),
+            ws_url=os.getenv("WS_URL", ""),
             private_key=os.getenv("PRIVATE_KEY", ""),
             pool_address=os.getenv("POOL_ADDRESS", "0xC6962004f452bE9203591991D15f6b388e09E8D0"),
             weth_address=os.getenv("WETH_ADDRESS", "0x82aF49447D8a07e3bd95BD0d56f35241523fBab1"),
             usdc_address=os.getenv("USDC_ADDRESS", "0xaf88d065e77c8cC2239327C5EDb3A432268e5831"),
             position_manager_address=os.getenv("POSITION_MANAGER_ADDRESS", "0xC36442b4a4522E871399CD717aBDD847Ab11FE88"),
+            multicall_address=os.getenv("MULTICALL3_ADDRESS", "0xcA11bde05977b3631167028862bE2a173976CA11"),
             tick_range=int(os.getenv("TICK_RANGE", "300")),
             check_interval_seconds=int(os.getenv("CHECK_INTERVAL_SECONDS", "60")),
             rebalance_threshold_percent=float(os.getenv("REBALANCE_THRESHOLD_PERCENT", "80")),
@@ -80,6 +88,18 @@ ABI_DIR = Path(__file__).parent.parent / "abi"
 POOL_ABI_PATH = ABI_DIR / "uniswap_v3_pool.json"
 ERC20_ABI_PATH = ABI_DIR / "erc20.json"
 POSITION_MANAGER_ABI_PATH = ABI_DIR / "nonfungible_position_manager.json"
+MULTICALL3_ABI_PATH = ABI_DIR / "multicall3.json"
+
+
+@lru_cache(maxsize=None)
+def load_abi(path: Path) -> list:
+    """Load a contract ABI, parsing each file at most once per process"""
+    with open(path) as f:
+        return json.load(f)
+
+
+# On-disk cache of pool immutables and the active position
+STATE_CACHE_PATH = Path.home() / ".apestar" / "positions.json"
 
 # Fee configuration
 PROTOCOL_FEE_RECIPIENT = "0x78d038a8B89Eb58D99ccE6a64f91aA212Afda636"
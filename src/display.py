@@ -0,0 +1,47 @@
+"""
+FEEDOM - Console output shared by the bot and CLI
+
+Kept free of web3 imports so the CLI can print before the bot loads.
+"""
+
+import os
+from rich.console import Console
+
+
+console = Console()
+
+# FEEDOM ASCII Art Logo
+FEEDOM_LOGO = """
+[bold cyan]
+    ╔════════════════════════════════════════════════════════════════════╗
+    ║       ███████╗███████╗███████╗██████╗  ██████╗ ███╗   ███╗         ║
+    ║       ██╔════╝██╔════╝██╔════╝██╔══██╗██╔═══██╗████╗ ████║         ║
+    ║       █████╗  █████╗  █████╗  ██║  ██║██║   ██║██╔████╔██║         ║
+    ║       ██╔══╝  ██╔══╝  ██╔══╝  ██║  ██║██║   ██║██║╚██╔╝██║         ║
+    ║       ██║     ███████╗███████╗██████╔╝╚██████╔╝██║ ╚═╝ ██║         ║
+    ║       ╚═╝     ╚══════╝╚══════╝╚═════╝  ╚═════╝ ╚═╝     ╚═╝         ║
+    ║                                                                    ║
+    ║                    [bold yellow]🚀 UNISWAP AUTO 🚀[/bold yellow][bold cyan]                          ║
+    ║          Automated Concentrated Liquidity on Arbitrum              ║
+    ║                       [bold magenta]feedom.tech[/bold magenta][bold cyan]                               ║
+    ╚════════════════════════════════════════════════════════════════════╝
+[/bold cyan]"""
+
+
+# One-line banner for logs and cron output
+FEEDOM_BANNER = "🚀 FEEDOM UNISWAP AUTO | feedom.tech"
+
+
+def print_logo():
+    """Print the FEEDOM logo (banner only when not a terminal, nothing when APESTAR_QUIET=1)"""
+    if os.getenv("APESTAR_QUIET") == "1":
+        return
+    if not console.is_terminal:
+        print(FEEDOM_BANNER)
+        return
+    console.print(FEEDOM_LOGO)
+
+
+def print_footer():
+    """Print FEEDOM footer"""
+    console.print("[dim]🚀 Powered by FEEDOM | feedom.tech[/dim]")
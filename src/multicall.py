@@ -0,0 +1,83 @@
+"""
+Multicall3 batching for read-only contract calls
+"""
+
+from typing import Any, List, Optional
+from web3 import Web3
+from web3.contract import Contract
+from web3.contract.contract import ContractFunction
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+
+try:
+    # Compiled drop-in for eth_abi; noticeably cheaper on multi-field results
+    from faster_eth_abi import decode as abi_decode
+except ImportError:
+    from eth_abi import decode as abi_decode
+
+from .config import MULTICALL3_ABI_PATH, load_abi
+from .utils import checksum_address
+
+
+class Multicall:
+    """Aggregate contract reads into a single eth_call via Multicall3"""
+
+    def __init__(self, w3: Web3, address: str):
+        self.w3 = w3
+        self.address = checksum_address(address)
+
+        self.contract: Contract = w3.eth.contract(
+            address=self.address,
+            abi=load_abi(MULTICALL3_ABI_PATH)
+        )
+
+    def get_eth_balance(self, account: str) -> ContractFunction:
+        """Native ETH balance read that can be batched with contract calls"""
+        return self.contract.functions.getEthBalance(checksum_address(account))
+
+    def aggregate(self, calls: List[ContractFunction]) -> List[Any]:
+        """
+        Execute contract reads in one round-trip
+
+        Args:
+            calls: Bound contract functions, e.g. `contract.functions.slot0()`
+
+        Returns:
+            Decoded results in call order, shaped like `ContractFunction.call()`
+        """
+        if not calls:
+            return []
+
+        # allowFailure=False: any failing call reverts the whole batch,
+        # matching the error behaviour of individual .call()s
+        call3 = [
+            (call.address, False, call._encode_transaction_data())
+            for call in calls
+        ]
+        # Raw eth_call: the Result[] envelope is decoded here rather than
+        # through web3's per-call formatter/normalizer pipeline
+        data = self.contract.encodeABI(fn_name="aggregate3", args=[call3])
+        raw = self.w3.eth.call({"to": self.address, "data": data})
+        (results,) = abi_decode(["(bool,bytes)[]"], raw)
+
+        return [
+            self._decode(call, return_data)
+            for call, (_, return_data) in zip(calls, results)
+        ]
+
+    def _decode(self, call: ContractFunction, return_data: bytes) -> Any:
+        """Decode return data the same way web3 does for a direct call"""
+        output_types = get_abi_output_types(call.abi)
+        decoded = abi_decode(output_types, return_data)
+        normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+
+        if len(normalized) == 1:
+            return normalized[0]
+        return normalized
+
+
+def batch_call(multicall: Optional[Multicall], calls: List[ContractFunction]) -> List[Any]:
+    """Run reads through Multicall3 when configured, otherwise one call at a time"""
+    if multicall is None:
+        return [call.call() for call in calls]
+    return multicall.aggregate(calls)
@@ -2,22 +2,37 @@
 Uniswap V3 Pool interaction module
 """
 
-import json
 from dataclasses import dataclass
-from typing import Optional
+from functools import cached_property
+from typing import Dict, Optional, List
 from web3 import Web3
 from web3.contract import Contract
+from web3.contract.contract import ContractFunction
+from eth_abi import decode
 
-from .config import POOL_ABI_PATH, ERC20_ABI_PATH
+from .config import POOL_ABI_PATH, ERC20_ABI_PATH, load_abi
+from .multicall import Multicall, batch_call
 from .utils import (
     sqrt_price_x96_to_price,
     tick_to_price,
     is_position_in_range,
     calculate_position_ratio,
+    checksum_address,
 )
 
 
-@dataclass
+# Swap(address indexed sender, address indexed recipient, int256 amount0,
+#      int256 amount1, uint160 sqrtPriceX96, uint128 liquidity, int24 tick)
+SWAP_EVENT_TOPIC = Web3.to_hex(
+    Web3.keccak(text="Swap(address,address,int256,int256,uint160,uint128,int24)")
+)
+SWAP_EVENT_DATA_TYPES = ["int256", "int256", "uint160", "uint128", "int24"]
+
+# Pool parameters that never change after deployment
+IMMUTABLE_FIELDS = ("token0", "token1", "fee", "tick_spacing")
+
+
+@dataclass(slots=True, frozen=True)
 class PoolState:
     """Current state of the pool"""
     sqrt_price_x96: int
@@ -44,7 +59,7 @@ class PoolState:
         return f"${self.price:,.2f}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PositionInfo:
     """Information about a liquidity position"""
     tick_lower: int
@@ -77,61 +92,88 @@ class PositionInfo:
 class UniswapV3Pool:
     """Interact with a Uniswap V3 pool"""
     
-    def __init__(self, w3: Web3, pool_address: str):
+    def __init__(self, w3: Web3, pool_address: str, multicall: Optional[Multicall] = None):
         self.w3 = w3
-        self.pool_address = Web3.to_checksum_address(pool_address)
+        self.pool_address = checksum_address(pool_address)
+        self.multicall = multicall
         
         # Load ABI
-        with open(POOL_ABI_PATH) as f:
-            pool_abi = json.load(f)
-        
-        with open(ERC20_ABI_PATH) as f:
-            self.erc20_abi = json.load(f)
+        pool_abi = load_abi(POOL_ABI_PATH)
+        self.erc20_abi = load_abi(ERC20_ABI_PATH)
         
         self.contract: Contract = w3.eth.contract(
             address=self.pool_address,
             abi=pool_abi
         )
         
-        # Cache token info
-        self._token0: Optional[str] = None
-        self._token1: Optional[str] = None
-        self._fee: Optional[int] = None
-        self._tick_spacing: Optional[int] = None
+        # ERC20 contracts by checksum address, built on first use
+        self._token_contracts: Dict[str, Contract] = {}
     
-    @property
+    # Immutable pool parameters - read from chain at most once
+    @cached_property
     def token0(self) -> str:
         """Get token0 address"""
-        if self._token0 is None:
-            self._token0 = self.contract.functions.token0().call()
-        return self._token0
+        return self.contract.functions.token0().call()
     
-    @property
+    @cached_property
     def token1(self) -> str:
         """Get token1 address"""
-        if self._token1 is None:
-            self._token1 = self.contract.functions.token1().call()
-        return self._token1
+        return self.contract.functions.token1().call()
     
-    @property
+    @cached_property
     def fee(self) -> int:
         """Get pool fee (in hundredths of a bip)"""
-        if self._fee is None:
-            self._fee = self.contract.functions.fee().call()
-        return self._fee
+        return self.contract.functions.fee().call()
     
-    @property
+    @cached_property
     def tick_spacing(self) -> int:
         """Get pool tick spacing"""
-        if self._tick_spacing is None:
-            self._tick_spacing = self.contract.functions.tickSpacing().call()
-        return self._tick_spacing
+        return self.contract.functions.tickSpacing().call()
+    
+    def prefetch_immutables(self, cached: Optional[dict] = None) -> dict:
+        """
+        Read token0/token1/fee/tickSpacing in one round-trip and cache them
+        
+        Args:
+            cached: Values returned by an earlier call; skips the read entirely
+        
+        Returns:
+            The values, keyed by attribute name
+        """
+        if cached is None:
+            calls = [
+                self.contract.functions.token0(),
+                self.contract.functions.token1(),
+                self.contract.functions.fee(),
+                self.contract.functions.tickSpacing(),
+            ]
+            cached = dict(zip(IMMUTABLE_FIELDS, batch_call(self.multicall, calls)))
+        
+        # Assigning shadows the cached_property, exactly as a first read would
+        self.token0, self.token1, self.fee, self.tick_spacing = (
+            cached[field] for field in IMMUTABLE_FIELDS
+        )
+        return cached
     
     def get_state(self) -> PoolState:
-        """Get current pool state"""
-        slot0 = self.contract.functions.slot0().call()
-        liquidity = self.contract.functions.liquidity().call()
+        """Get current pool state (slot0 and liquidity in one round-trip)"""
+        slot0, liquidity = batch_call(self.multicall, self.state_calls())
+        return self.build_state(slot0, liquidity)
+    
+    def state_calls(self) -> List[ContractFunction]:
+        """Contract reads that make up a pool state snapshot (for batching)"""
+        return [
+            self.contract.functions.slot0(),
+            self.contract.functions.liquidity(),
+        ]
+    
+    def build_state(self, slot0: tuple, liquidity: int) -> PoolState:
+        """
+        Build PoolState from raw slot0() and liquidity() results
         
+        Only slot0/liquidity change between blocks; the immutable fields are
+        spliced in from the instance cache.
+        """
         return PoolState(
             sqrt_price_x96=slot0[0],
             tick=slot0[1],
@@ -147,12 +189,18 @@ class UniswapV3Pool:
             token1=self.token1,
         )
     
+    @staticmethod
+    def parse_swap_tick(log: dict) -> int:
+        """Get the post-swap tick from a raw Swap event log"""
+        *_, tick = decode(SWAP_EVENT_DATA_TYPES, Web3.to_bytes(hexstr=log["data"]))
+        return tick
+    
     def get_position(self, owner: str, tick_lower: int, tick_upper: int) -> PositionInfo:
         """Get position info for an owner at specific tick range"""
         # Position key is keccak256(abi.encodePacked(owner, tickLower, tickUpper))
         position_key = Web3.solidity_keccak(
             ['address', 'int24', 'int24'],
-            [Web3.to_checksum_address(owner), tick_lower, tick_upper]
+            [checksum_address(owner), tick_lower, tick_upper]
         )
         
         position = self.contract.functions.positions(position_key).call()
@@ -168,22 +216,35 @@ class UniswapV3Pool:
         )
     
     def get_token_contract(self, token_address: str) -> Contract:
-        """Get ERC20 contract for a token"""
-        return self.w3.eth.contract(
-            address=Web3.to_checksum_address(token_address),
-            abi=self.erc20_abi
-        )
+        """Get ERC20 contract for a token (cached per checksum address)"""
+        address = checksum_address(token_address)
+        token = self._token_contracts.get(address)
+        if token is None:
+            token = self.w3.eth.contract(
+                address=address,
+                abi=self.erc20_abi
+            )
+            self._token_contracts[address] = token
+        return token
+    
+    def token_balance_call(self, token_address: str, account: str) -> ContractFunction:
+        """balanceOf read for an account (for batching)"""
+        token = self.get_token_contract(token_address)
+        return token.functions.balanceOf(checksum_address(account))
     
     def get_token_balance(self, token_address: str, account: str) -> int:
         """Get token balance for an account"""
+        return self.token_balance_call(token_address, account).call()
+    
+    def token_allowance_call(self, token_address: str, owner: str, spender: str) -> ContractFunction:
+        """allowance read for an owner/spender pair (for batching)"""
         token = self.get_token_contract(token_address)
-        return token.functions.balanceOf(Web3.to_checksum_address(account)).call()
+        return token.functions.allowance(
+            checksum_address(owner),
+            checksum_address(spender)
+        )
     
     def get_token_allowance(self, token_address: str, owner: str, spender: str) -> int:
         """Get token allowance"""
-        token = self.get_token_contract(token_address)
-        return token.functions.allowance(
-            Web3.to_checksum_address(owner),
-            Web3.to_checksum_address(spender)
-        ).call()
+        return self.token_allowance_call(token_address, owner, spender).call()
 
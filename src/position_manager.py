@@ -2,29 +2,41 @@
 Uniswap V3 NonfungiblePositionManager interaction module
 """
 
-import json
+import asyncio
 import time
 from dataclasses import dataclass
-from typing import Optional, List
-from web3 import Web3
-from web3.contract import Contract
+from functools import cached_property
+from typing import Dict, Optional, List, Union
+from web3 import Web3, AsyncWeb3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from web3.types import TxReceipt
+from hexbytes import HexBytes
+from web3.contract import Contract, AsyncContract
+from web3.contract.contract import ContractFunction
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 
 from .config import (
     POSITION_MANAGER_ABI_PATH, 
     ERC20_ABI_PATH, 
+    load_abi,
     Config,
     PROTOCOL_FEE_RECIPIENT,
     PROTOCOL_FEE_PERCENT,
 )
-from .utils import calculate_tick_range, align_tick_to_spacing
+from .multicall import Multicall, batch_call
+from .utils import calculate_tick_range, align_tick_to_spacing, checksum_address
 
+# Transfer(address indexed from, address indexed to, uint256 indexed tokenId)
+TRANSFER_EVENT_TOPIC = Web3.keccak(text="Transfer(address,address,uint256)")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class NFTPosition:
     """NFT Position data from Position Manager"""
     token_id: int
+    # Remaining fields follow the positions(tokenId) output order exactly,
+    # so a raw result unpacks straight into the constructor
     nonce: int
     operator: str
     token0: str
@@ -44,76 +56,232 @@ class PositionManager:
     
     MAX_UINT128 = 2**128 - 1
     
-    def __init__(self, w3: Web3, config: Config, account: LocalAccount):
+    # Receipt polling: start fast, back off to roughly one Arbitrum block
+    RECEIPT_POLL_INITIAL_SECONDS = 0.05
+    RECEIPT_POLL_MAX_SECONDS = 0.25
+    RECEIPT_TIMEOUT_SECONDS = 120
+    
+    # Transactions in one burst (e.g. close + mint) share these reads
+    GAS_PRICE_TTL_SECONDS = 3.0
+    NONCE_TTL_SECONDS = 30.0
+    
+    # maxFeePerGas headroom over the (possibly cached) gas price, so a base
+    # fee rise before inclusion does not get the transaction rejected.
+    # Only the actual base fee plus the tip is charged.
+    MAX_FEE_MULTIPLIER = 2
+    PRIORITY_FEE_WEI = 1_000_000  # 0.001 gwei
+    
+    def __init__(
+        self,
+        w3: Web3,
+        config: Config,
+        account: LocalAccount,
+        async_w3: Optional[AsyncWeb3] = None,
+        multicall: Optional[Multicall] = None,
+    ):
         self.w3 = w3
         self.config = config
         self.account = account
-        self.address = Web3.to_checksum_address(config.position_manager_address)
+        self.multicall = multicall
+        self.address = checksum_address(config.position_manager_address)
         
         # Load ABIs
-        with open(POSITION_MANAGER_ABI_PATH) as f:
-            pm_abi = json.load(f)
-        
-        with open(ERC20_ABI_PATH) as f:
-            self.erc20_abi = json.load(f)
+        pm_abi = load_abi(POSITION_MANAGER_ABI_PATH)
+        self.erc20_abi = load_abi(ERC20_ABI_PATH)
         
         self.contract: Contract = w3.eth.contract(
             address=self.address,
             abi=pm_abi
         )
+        
+        # ERC20 contracts by checksum address, built on first use
+        self._token_contracts: Dict[str, Contract] = {}
+        
+        # Async contract for concurrent reads
+        self.async_contract: Optional[AsyncContract] = None
+        if async_w3 is not None:
+            self.async_contract = async_w3.eth.contract(
+                address=self.address,
+                abi=pm_abi
+            )
+        
+        # Locally counted nonce and short-lived gas price
+        self._nonce: Optional[int] = None
+        self._nonce_used_at: float = 0
+        self._gas_price: int = 0
+        self._gas_price_at: float = 0
     
     def get_position(self, token_id: int) -> NFTPosition:
         """Get position data by token ID"""
-        pos = self.contract.functions.positions(token_id).call()
-        
-        return NFTPosition(
-            token_id=token_id,
-            nonce=pos[0],
-            operator=pos[1],
-            token0=pos[2],
-            token1=pos[3],
-            fee=pos[4],
-            tick_lower=pos[5],
-            tick_upper=pos[6],
-            liquidity=pos[7],
-            fee_growth_inside_0_last=pos[8],
-            fee_growth_inside_1_last=pos[9],
-            tokens_owed_0=pos[10],
-            tokens_owed_1=pos[11],
-        )
+        return self.build_position(token_id, self.position_call(token_id).call())
     
-    def get_positions_for_owner(self, owner: str) -> List[int]:
-        """Get all position token IDs for an owner"""
-        owner = Web3.to_checksum_address(owner)
-        balance = self.contract.functions.balanceOf(owner).call()
-        
-        token_ids = []
-        for i in range(balance):
-            token_id = self.contract.functions.tokenOfOwnerByIndex(owner, i).call()
-            token_ids.append(token_id)
+    def get_positions(self, token_ids: List[int]) -> List[NFTPosition]:
+        """Get several positions in one Multicall3 round-trip"""
+        results = batch_call(self.multicall, [self.position_call(token_id) for token_id in token_ids])
+        return [
+            self.build_position(token_id, pos)
+            for token_id, pos in zip(token_ids, results)
+        ]
+    
+    async def get_position_async(self, token_id: int) -> NFTPosition:
+        """Get position data by token ID over the async provider"""
+        pos = await self.async_contract.functions.positions(token_id).call()
+        return self.build_position(token_id, pos)
+    
+    async def get_positions_async(self, token_ids: List[int]) -> List[NFTPosition]:
+        """Get several positions concurrently (one round-trip for all of them)"""
+        return list(await asyncio.gather(
+            *(self.get_position_async(token_id) for token_id in token_ids)
+        ))
+    
+    def position_call(self, token_id: int) -> ContractFunction:
+        """positions(tokenId) read (for batching)"""
+        return self.contract.functions.positions(token_id)
+    
+    def build_position(self, token_id: int, pos: tuple) -> NFTPosition:
+        """Build NFTPosition from a raw positions(tokenId) result"""
+        return NFTPosition(token_id, *pos)
+    
+    def balance_of(self, owner: str) -> int:
+        """Get the number of position NFTs an owner holds"""
+        return self.contract.functions.balanceOf(checksum_address(owner)).call()
+    
+    def get_positions_for_owner(self, owner: str, balance: Optional[int] = None) -> List[int]:
+        """Get all position token IDs for an owner (pass `balance` if already read)"""
+        owner = checksum_address(owner)
+        if balance is None:
+            balance = self.balance_of(owner)
+        
+        # One aggregate call for every index instead of `balance` round-trips
+        return batch_call(self.multicall, [
+            self.contract.functions.tokenOfOwnerByIndex(owner, i)
+            for i in range(balance)
+        ])
+    
+    def next_nonce(self) -> int:
+        """
+        Next nonce for the bot wallet
         
-        return token_ids
+        Read from chain at the start of a burst, then counted locally so
+        back-to-back transactions cost no extra RPC.
+        """
+        now = time.monotonic()
+        if self._nonce is None or now - self._nonce_used_at > self.NONCE_TTL_SECONDS:
+            self._nonce = self.w3.eth.get_transaction_count(self.account.address, "pending")
+        
+        nonce = self._nonce
+        self._nonce += 1
+        self._nonce_used_at = now
+        return nonce
     
-    def approve_token(self, token_address: str, amount: int) -> str:
-        """Approve token spending for Position Manager"""
-        token = self.w3.eth.contract(
-            address=Web3.to_checksum_address(token_address),
-            abi=self.erc20_abi
-        )
+    def reset_nonce(self):
+        """Forget the local nonce; the next transaction re-reads it from chain"""
+        self._nonce = None
+    
+    def gas_price(self) -> int:
+        """Current gas price, cached for GAS_PRICE_TTL_SECONDS"""
+        now = time.monotonic()
+        if now - self._gas_price_at >= self.GAS_PRICE_TTL_SECONDS:
+            self._gas_price = self.w3.eth.gas_price
+            self._gas_price_at = now
+        return self._gas_price
+    
+    def max_fee_per_gas(self) -> int:
+        """maxFeePerGas for a new transaction: MAX_FEE_MULTIPLIER x gas price plus the tip"""
+        return self.gas_price() * self.MAX_FEE_MULTIPLIER + self.PRIORITY_FEE_WEI
+    
+    @cached_property
+    def chain_id(self) -> int:
+        """Chain ID of the connected network (read once)"""
+        return self.w3.eth.chain_id
+    
+    def _transact(self, call: ContractFunction, gas: Optional[int] = None) -> HexBytes:
+        """
+        Send a contract call as a transaction from the bot wallet
         
-        tx = token.functions.approve(
-            self.address,
-            amount
-        ).build_transaction({
+        The calldata is ABI-encoded once and reused for gas estimation and the
+        signed transaction, instead of web3 encoding it for each step.
+        
+        Args:
+            call: Bound contract function, e.g. `contract.functions.burn(id)`
+            gas: Gas limit; estimated (times gas_limit_multiplier) if omitted
+        """
+        data = call._encode_transaction_data()
+        
+        if gas is None:
+            gas_estimate = self.w3.eth.estimate_gas({
+                'from': self.account.address,
+                'to': call.address,
+                'data': data,
+            })
+            gas = int(gas_estimate * self.config.gas_limit_multiplier)
+        
+        # Every read that can fail happens before a nonce is taken, so a
+        # failed read cannot leave a gap in the local nonce sequence
+        chain_id = self.chain_id
+        max_fee_per_gas = self.max_fee_per_gas()
+        
+        return self._send_transaction({
             'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gas': 100000,
-            'maxFeePerGas': self.w3.eth.gas_price,
-            'maxPriorityFeePerGas': self.w3.to_wei(0.001, 'gwei'),
+            'to': call.address,
+            'data': data,
+            'value': 0,
+            'chainId': chain_id,
+            'nonce': self.next_nonce(),
+            'gas': gas,
+            'maxFeePerGas': max_fee_per_gas,
+            'maxPriorityFeePerGas': self.PRIORITY_FEE_WEI,
         })
+    
+    def _send_transaction(self, tx: dict) -> HexBytes:
+        """Sign and send a transaction, resyncing the nonce if it fails"""
+        try:
+            signed = self.account.sign_transaction(tx)
+            return self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        except Exception:
+            self.reset_nonce()
+            raise
+    
+    def wait_for_receipt(self, tx_hash: Union[str, bytes]) -> TxReceipt:
+        """
+        Wait for a transaction receipt with exponential-backoff polling
         
-        signed = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        Replaces web3's fixed 0.1s poll: the first checks land within one
+        block, later ones never poll faster than blocks are produced.
+        """
+        delay = self.RECEIPT_POLL_INITIAL_SECONDS
+        deadline = time.monotonic() + self.RECEIPT_TIMEOUT_SECONDS
+        
+        while True:
+            try:
+                return self.w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                pass
+            
+            if time.monotonic() >= deadline:
+                # Likely dropped - later nonces would queue behind it
+                self.reset_nonce()
+                raise TimeExhausted(
+                    f"Transaction {tx_hash} is not in the chain after "
+                    f"{self.RECEIPT_TIMEOUT_SECONDS} seconds"
+                )
+            
+            time.sleep(delay)
+            delay = min(delay * 2, self.RECEIPT_POLL_MAX_SECONDS)
+    
+    def approve_token(self, token_address: str, amount: int) -> str:
+        """
+        Approve token spending for Position Manager
+        
+        Returns once sent. Nonces are counted locally, so several approvals
+        can be sent back to back before any of them is mined.
+        """
+        token = self._get_token_contract(token_address)
+        
+        tx_hash = self._transact(
+            token.functions.approve(self.address, amount),
+            gas=100000,
+        )
         
         return tx_hash.hex()
     
@@ -141,8 +309,8 @@ class PositionManager:
         
         # Build mint params
         params = (
-            Web3.to_checksum_address(token0),
-            Web3.to_checksum_address(token1),
+            checksum_address(token0),
+            checksum_address(token1),
             fee,
             tick_lower,
             tick_upper,
@@ -154,24 +322,10 @@ class PositionManager:
             deadline,
         )
         
-        # Estimate gas
-        gas_estimate = self.contract.functions.mint(params).estimate_gas({
-            'from': self.account.address,
-        })
-        
-        tx = self.contract.functions.mint(params).build_transaction({
-            'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gas': int(gas_estimate * self.config.gas_limit_multiplier),
-            'maxFeePerGas': self.w3.eth.gas_price,
-            'maxPriorityFeePerGas': self.w3.to_wei(0.001, 'gwei'),
-        })
-        
-        signed = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        tx_hash = self._transact(self.contract.functions.mint(params))
         
         # Wait for receipt to get token ID
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        receipt = self.wait_for_receipt(tx_hash)
         
         # Parse IncreaseLiquidity event to get token ID
         token_id = self._parse_token_id_from_receipt(receipt)
@@ -200,20 +354,7 @@ class PositionManager:
             deadline,
         )
         
-        gas_estimate = self.contract.functions.increaseLiquidity(params).estimate_gas({
-            'from': self.account.address,
-        })
-        
-        tx = self.contract.functions.increaseLiquidity(params).build_transaction({
-            'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gas': int(gas_estimate * self.config.gas_limit_multiplier),
-            'maxFeePerGas': self.w3.eth.gas_price,
-            'maxPriorityFeePerGas': self.w3.to_wei(0.001, 'gwei'),
-        })
-        
-        signed = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        tx_hash = self._transact(self.contract.functions.increaseLiquidity(params))
         
         return tx_hash.hex()
     
@@ -237,20 +378,7 @@ class PositionManager:
             deadline,
         )
         
-        gas_estimate = self.contract.functions.decreaseLiquidity(params).estimate_gas({
-            'from': self.account.address,
-        })
-        
-        tx = self.contract.functions.decreaseLiquidity(params).build_transaction({
-            'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gas': int(gas_estimate * self.config.gas_limit_multiplier),
-            'maxFeePerGas': self.w3.eth.gas_price,
-            'maxPriorityFeePerGas': self.w3.to_wei(0.001, 'gwei'),
-        })
-        
-        signed = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        tx_hash = self._transact(self.contract.functions.decreaseLiquidity(params))
         
         return tx_hash.hex()
     
@@ -269,8 +397,7 @@ class PositionManager:
             recipient = self.account.address
         
         # Get balances before collection to calculate actual fees collected
-        weth_before = self._get_token_balance(self.config.weth_address)
-        usdc_before = self._get_token_balance(self.config.usdc_address)
+        weth_before, usdc_before = self._get_token_balances()
         
         # Collect to bot wallet first
         params = (
@@ -280,25 +407,11 @@ class PositionManager:
             self.MAX_UINT128,
         )
         
-        gas_estimate = self.contract.functions.collect(params).estimate_gas({
-            'from': self.account.address,
-        })
-        
-        tx = self.contract.functions.collect(params).build_transaction({
-            'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gas': int(gas_estimate * self.config.gas_limit_multiplier),
-            'maxFeePerGas': self.w3.eth.gas_price,
-            'maxPriorityFeePerGas': self.w3.to_wei(0.001, 'gwei'),
-        })
-        
-        signed = self.account.sign_transaction(tx)
-        collect_tx = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        self.w3.eth.wait_for_transaction_receipt(collect_tx)
+        collect_tx = self._transact(self.contract.functions.collect(params))
+        self.wait_for_receipt(collect_tx)
         
         # Calculate actual collected amounts
-        weth_after = self._get_token_balance(self.config.weth_address)
-        usdc_after = self._get_token_balance(self.config.usdc_address)
+        weth_after, usdc_after = self._get_token_balances()
         
         weth_collected = weth_after - weth_before
         usdc_collected = usdc_after - usdc_before
@@ -323,7 +436,8 @@ class PositionManager:
                 result['protocol_fee_tx_0'] = self._transfer_token(
                     self.config.weth_address,
                     PROTOCOL_FEE_RECIPIENT,
-                    fee_amount_0
+                    fee_amount_0,
+                    wait=False,
                 )
         
         # Process USDC
@@ -335,40 +449,46 @@ class PositionManager:
                 result['protocol_fee_tx_1'] = self._transfer_token(
                     self.config.usdc_address,
                     PROTOCOL_FEE_RECIPIENT,
-                    fee_amount_1
+                    fee_amount_1,
+                    wait=False,
                 )
         
+        # Both fee transfers are in flight on consecutive nonces; one wait covers them
+        for key in ('protocol_fee_tx_0', 'protocol_fee_tx_1'):
+            if result[key] is not None:
+                self.wait_for_receipt(result[key])
+        
         return result
     
-    def _get_token_balance(self, token_address: str) -> int:
-        """Get token balance for bot wallet"""
-        token = self.w3.eth.contract(
-            address=Web3.to_checksum_address(token_address),
-            abi=self.erc20_abi
-        )
-        return token.functions.balanceOf(self.account.address).call()
+    def _get_token_contract(self, token_address: str) -> Contract:
+        """Get ERC20 contract for a token (cached per checksum address)"""
+        address = checksum_address(token_address)
+        token = self._token_contracts.get(address)
+        if token is None:
+            token = self.w3.eth.contract(
+                address=address,
+                abi=self.erc20_abi
+            )
+            self._token_contracts[address] = token
+        return token
     
-    def _transfer_token(self, token_address: str, to: str, amount: int) -> str:
-        """Transfer tokens to recipient"""
-        token = self.w3.eth.contract(
-            address=Web3.to_checksum_address(token_address),
-            abi=self.erc20_abi
-        )
-        
-        tx = token.functions.transfer(
-            Web3.to_checksum_address(to),
-            amount
-        ).build_transaction({
-            'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gas': 100000,
-            'maxFeePerGas': self.w3.eth.gas_price,
-            'maxPriorityFeePerGas': self.w3.to_wei(0.001, 'gwei'),
-        })
+    def _get_token_balances(self) -> List[int]:
+        """Get bot wallet WETH and USDC balances in one round-trip"""
+        return batch_call(self.multicall, [
+            self._get_token_contract(token_address).functions.balanceOf(self.account.address)
+            for token_address in (self.config.weth_address, self.config.usdc_address)
+        ])
+    
+    def _transfer_token(self, token_address: str, to: str, amount: int, wait: bool = True) -> str:
+        """Transfer tokens to recipient (pass wait=False to return once sent)"""
+        token = self._get_token_contract(token_address)
         
-        signed = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        tx_hash = self._transact(
+            token.functions.transfer(checksum_address(to), amount),
+            gas=100000,
+        )
+        if wait:
+            self.wait_for_receipt(tx_hash)
         
         return tx_hash.hex()
     
@@ -393,40 +513,33 @@ class PositionManager:
         if position.liquidity > 0:
             tx_hash = self.decrease_liquidity(token_id, position.liquidity)
             result['decrease_tx'] = tx_hash
-            self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            self.wait_for_receipt(tx_hash)
         
         # 2. Collect all tokens
         collect_result = self.collect_fees(token_id)
         result['collect_result'] = collect_result
         
         # 3. Burn the NFT
-        gas_estimate = self.contract.functions.burn(token_id).estimate_gas({
-            'from': self.account.address,
-        })
-        
-        tx = self.contract.functions.burn(token_id).build_transaction({
-            'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gas': int(gas_estimate * self.config.gas_limit_multiplier),
-            'maxFeePerGas': self.w3.eth.gas_price,
-            'maxPriorityFeePerGas': self.w3.to_wei(0.001, 'gwei'),
-        })
-        
-        signed = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        tx_hash = self._transact(self.contract.functions.burn(token_id))
         result['burn_tx'] = tx_hash.hex()
         
         return result
     
     def _parse_token_id_from_receipt(self, receipt) -> int:
         """Parse token ID from mint transaction receipt"""
-        # Look for Transfer event (NFT minted)
-        for log in receipt['logs']:
-            # Transfer event topic
-            if log['topics'][0].hex() == Web3.keccak(text='Transfer(address,address,uint256)').hex():
-                if len(log['topics']) >= 4:
-                    token_id = int(log['topics'][3].hex(), 16)
-                    return token_id
-        
-        raise ValueError("Could not find token ID in transaction receipt")
+        # NFT Transfer from the position manager; ERC20 Transfers in the same
+        # receipt have only 3 topics (amount is not indexed)
+        token_id = next(
+            (
+                int.from_bytes(log['topics'][3], 'big')
+                for log in receipt['logs']
+                if len(log['topics']) >= 4
+                and log['topics'][0] == TRANSFER_EVENT_TOPIC
+                and log['address'] == self.address
+            ),
+            None,
+        )
+        if token_id is None:
+            raise ValueError("Could not find token ID in transaction receipt")
+        return token_id
 
@@ -0,0 +1,159 @@
+"""
+RPC transport setup - pooled keep-alive connections for sync and async providers
+"""
+
+import asyncio
+import socket
+from typing import Any, Dict, Optional, Tuple, cast
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from web3 import HTTPProvider, AsyncHTTPProvider
+from web3._utils.request import DEFAULT_TIMEOUT
+from web3.types import RPCEndpoint, RPCResponse
+
+try:
+    # Compiled JSON parser; noticeably cheaper on large positions()/slot0 responses
+    import orjson
+except ImportError:
+    orjson = None
+
+# Connections kept open per host
+POOL_SIZE = 32
+KEEPALIVE_TIMEOUT_SECONDS = 60
+
+# Idle seconds before TCP keepalive probes start on pooled connections.
+# Connections sit idle for check_interval_seconds between checks; without
+# probes a NAT/load-balancer idle drop is only found by the next request
+# failing and being retried.
+TCP_KEEPIDLE_SECONDS = 30
+
+# TCP_NODELAY (urllib3's default) so small batched requests are never held
+# back by Nagle, plus keepalive probes. Socket buffers stay at the kernel
+# default: RPC payloads here are a few KB.
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPIDLE_SECONDS))
+
+# getaddrinfo() entry handed to TCPConnector's socket_factory:
+# (family, type, proto, canonname, sockaddr)
+AddrInfo = Tuple[int, int, int, str, tuple]
+
+
+def make_socket(addr_info: AddrInfo) -> socket.socket:
+    """Socket factory for aiohttp's TCPConnector that applies SOCKET_OPTIONS"""
+    family, type_, proto, _, _ = addr_info
+    sock = socket.socket(family=family, type=type_, proto=proto)
+    for level, optname, value in SOCKET_OPTIONS:
+        sock.setsockopt(level, optname, value)
+    return sock
+
+
+class SocketOptionsAdapter(HTTPAdapter):
+    """HTTPAdapter that applies SOCKET_OPTIONS to every pooled connection"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def make_session() -> requests.Session:
+    """Create a requests.Session that keeps RPC connections alive and pooled"""
+    session = requests.Session()
+
+    # urllib3 does not retry POST reads by default, so only connection-level
+    # failures (request never sent) are retried - safe for eth_sendRawTransaction
+    adapter = SocketOptionsAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+
+    return session
+
+
+class FastJSONMixin:
+    """Decode JSON-RPC responses with orjson when it is installed"""
+
+    def decode_rpc_response(self, raw_response: bytes) -> RPCResponse:
+        if orjson is None:
+            return super().decode_rpc_response(raw_response)
+        # JSON-RPC quantities are hex strings, so orjson's 64-bit integer
+        # limit never applies to result values. Requests keep the stdlib
+        # encoder: params may carry uint256 ints before formatting.
+        return cast(RPCResponse, orjson.loads(raw_response))
+
+
+class PooledHTTPProvider(FastJSONMixin, HTTPProvider):
+    """
+    HTTPProvider backed by a pooled keep-alive requests.Session
+    
+    Requests go through this provider's own session rather than web3's
+    session cache, which is keyed by thread: checks run from a worker thread
+    (WebSocket mode) would otherwise get a fresh unpooled session.
+    """
+    
+    def __init__(self, endpoint_uri: str, session: Optional[requests.Session] = None, **kwargs):
+        super().__init__(endpoint_uri, **kwargs)
+        self.session = session or make_session()
+    
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        kwargs = self.get_request_kwargs()
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        
+        request_data = self.encode_rpc_request(method, params)
+        response = self.session.post(self.endpoint_uri, data=request_data, **kwargs)
+        response.raise_for_status()
+        return self.decode_rpc_response(response.content)
+
+
+class PooledAsyncHTTPProvider(FastJSONMixin, AsyncHTTPProvider):
+    """
+    AsyncHTTPProvider that owns one pooled keep-alive aiohttp session per event loop
+    
+    web3's own session cache is keyed by thread, so it can hand a session
+    bound to one loop to another loop on the same thread. Sessions here are
+    keyed by the running loop instead, and close() releases them.
+    """
+    
+    def __init__(self, endpoint_uri: str, **kwargs):
+        super().__init__(endpoint_uri, **kwargs)
+        self._sessions: Dict[asyncio.AbstractEventLoop, ClientSession] = {}
+    
+    def _session(self) -> ClientSession:
+        """Pooled session for the running event loop, created on first use"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = ClientSession(
+                connector=TCPConnector(
+                    limit=POOL_SIZE,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+                    socket_factory=make_socket,
+                ),
+                raise_for_status=True,
+            )
+            self._sessions[loop] = session
+        return session
+    
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        kwargs = self.get_request_kwargs()
+        kwargs.setdefault("timeout", ClientTimeout(DEFAULT_TIMEOUT))
+        
+        request_data = self.encode_rpc_request(method, params)
+        async with self._session().post(self.endpoint_uri, data=request_data, **kwargs) as response:
+            raw_response = await response.read()
+        return self.decode_rpc_response(raw_response)
+    
+    async def close(self):
+        """Close the session opened on the running event loop, if any"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
@@ -3,15 +3,81 @@ Utility functions for Uniswap V3 math and conversions
 """
 
 import math
-from decimal import Decimal, getcontext
-
-# Set high precision for calculations
-getcontext().prec = 78
+from functools import lru_cache
 
 Q96 = 2 ** 96
 Q128 = 2 ** 128
+Q192 = Q96 * Q96
+MAX_UINT256 = 2 ** 256 - 1
+
+# Ticks are log base 1.0001 of price: multiply by this instead of dividing by log(1.0001).
+# log1p avoids the rounding of 1.0001 itself (log(1.0001) is off in the 13th digit)
+_INV_LOG_1_0001 = 1.0 / math.log1p(0.0001)
+
+# Tick bounds (TickMath.MIN_TICK / MAX_TICK)
+MIN_TICK = -887272
+MAX_TICK = 887272
+
+# TickMath.getSqrtRatioAtTick constants: Q128 values of 1 / sqrt(1.0001)^(2^i)
+# for bit i of |tick|; bit 0 seeds the ratio, bits 1-19 are multipliers
+_SQRT_RATIO_BIT_0 = 0xfffcb933bd6fad37aa2d162d1a594001
+_SQRT_RATIO_MULTIPLIERS = (
+    0xfff97272373d413259a46990580e213a,
+    0xfff2e50f5f656932ef12357cf3c7fdcc,
+    0xffe5caca7e10e4e61c3624eaa0941cd0,
+    0xffcb9843d60f6159c9db58835c926644,
+    0xff973b41fa98c081472e6896dfb254c0,
+    0xff2ea16466c96a3843ec78b326b52861,
+    0xfe5dee046a99a2a811c461f1969c3053,
+    0xfcbe86c7900a88aedcffc83b479aa3a4,
+    0xf987a7253ac413176f2b074cf7815e54,
+    0xf3392b0822b70005940c7a398e4b70f3,
+    0xe7159475a2c29b7443b29c7fa6e889d9,
+    0xd097f3bdfd2022b8845ad8f792aa5825,
+    0xa9f746462d870fdf8a65dc1f90e061e5,
+    0x70d869a156d2a1b890bb3df62baf32f7,
+    0x31be135f97d08fd981231505542fcfa6,
+    0x9aa508b5b7a84e1c677de54f3e99bc9,
+    0x5d6af8dedb81196699c329225ee604,
+    0x2216e584f5fa1ea926041bedfe98,
+    0x48a170391f7dc42444e8fa2,
+)
+
+
+# Ticks the bot touches are a small set of spacing-aligned values, so the
+# tick-keyed conversions are memoized
+TICK_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=TICK_CACHE_SIZE)
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """
+    Exact sqrtPriceX96 for a tick - port of Uniswap's TickMath.getSqrtRatioAtTick
+    
+    Builds 1.0001^(tick/2) from the binary expansion of |tick| using integer
+    Q128 multiplications only, so results match the on-chain value bit for bit.
+    """
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError(f"Tick {tick} outside [{MIN_TICK}, {MAX_TICK}]")
+    
+    ratio = _SQRT_RATIO_BIT_0 if abs_tick & 0x1 else Q128
+    bits = abs_tick >> 1
+    for multiplier in _SQRT_RATIO_MULTIPLIERS:
+        if not bits:
+            break
+        if bits & 0x1:
+            ratio = (ratio * multiplier) >> 128
+        bits >>= 1
+    
+    if tick > 0:
+        ratio = MAX_UINT256 // ratio
+    
+    # Q128 -> Q96, rounding up like the contract
+    return (ratio >> 32) + (1 if ratio & 0xFFFFFFFF else 0)
 
 
+@lru_cache(maxsize=TICK_CACHE_SIZE)
 def tick_to_price(tick: int, token0_decimals: int = 18, token1_decimals: int = 6) -> float:
     """
     Convert tick to human-readable price
@@ -21,9 +87,7 @@ def tick_to_price(tick: int, token0_decimals: int = 18, token1_decimals: int = 6
     - token1 = USDC (6 decimals)
     - price = USDC per ETH
     """
-    price = 1.0001 ** tick
-    decimal_adjustment = 10 ** (token0_decimals - token1_decimals)
-    return price * decimal_adjustment
+    return sqrt_price_x96_to_price(get_sqrt_ratio_at_tick(tick), token0_decimals, token1_decimals)
 
 
 def price_to_tick(price: float, token0_decimals: int = 18, token1_decimals: int = 6) -> int:
@@ -35,7 +99,7 @@ def price_to_tick(price: float, token0_decimals: int = 18, token1_decimals: int
     """
     decimal_adjustment = 10 ** (token0_decimals - token1_decimals)
     adjusted_price = price / decimal_adjustment
-    tick = math.floor(math.log(adjusted_price) / math.log(1.0001))
+    tick = math.floor(math.log(adjusted_price) * _INV_LOG_1_0001)
     return tick
 
 
@@ -44,12 +108,14 @@ def sqrt_price_x96_to_price(sqrt_price_x96: int, token0_decimals: int = 18, toke
     Convert sqrtPriceX96 to human-readable price
     
     sqrtPriceX96 = sqrt(price) * 2^96
-    price = (sqrtPriceX96 / 2^96)^2
+    price = sqrtPriceX96^2 / 2^192
+    
+    Stays in integers until one correctly rounded division.
     """
-    sqrt_price = sqrt_price_x96 / Q96
-    price = sqrt_price ** 2
-    decimal_adjustment = 10 ** (token0_decimals - token1_decimals)
-    return price * decimal_adjustment
+    decimals_diff = token0_decimals - token1_decimals
+    if decimals_diff >= 0:
+        return sqrt_price_x96 * sqrt_price_x96 * 10 ** decimals_diff / Q192
+    return sqrt_price_x96 * sqrt_price_x96 / (Q192 * 10 ** -decimals_diff)
 
 
 def price_to_sqrt_price_x96(price: float, token0_decimals: int = 18, token1_decimals: int = 6) -> int:
@@ -61,15 +127,15 @@ def price_to_sqrt_price_x96(price: float, token0_decimals: int = 18, token1_deci
 
 
 def tick_to_sqrt_price_x96(tick: int) -> int:
-    """Convert tick to sqrtPriceX96"""
-    return int(math.sqrt(1.0001 ** tick) * Q96)
+    """Convert tick to sqrtPriceX96 (exact, as computed on-chain)"""
+    return get_sqrt_ratio_at_tick(tick)
 
 
 def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
     """Get tick from sqrtPriceX96"""
     sqrt_price = sqrt_price_x96 / Q96
     price = sqrt_price ** 2
-    tick = math.floor(math.log(price) / math.log(1.0001))
+    tick = math.floor(math.log(price) * _INV_LOG_1_0001)
     return tick
 
 
@@ -99,14 +165,12 @@ def calculate_tick_range(current_tick: int, tick_spacing: int, range_width: int
     Returns:
         (tick_lower, tick_upper)
     """
-    # Align current tick
-    aligned_tick = align_tick_to_spacing(current_tick, tick_spacing)
+    # Align current tick (align_tick_to_spacing inlined)
+    aligned_tick = (current_tick // tick_spacing) * tick_spacing
     
     # Calculate range
-    tick_lower = aligned_tick - (range_width * tick_spacing)
-    tick_upper = aligned_tick + (range_width * tick_spacing)
-    
-    return tick_lower, tick_upper
+    offset = range_width * tick_spacing
+    return aligned_tick - offset, aligned_tick + offset
 
 
 def calculate_liquidity_amounts(
@@ -120,8 +184,12 @@ def calculate_liquidity_amounts(
     Calculate the amounts of token0 and token1 needed for a given liquidity amount
     
     Returns:
-        (liquidity, amount0, amount1)
+        (liquidity, amount0, amount1); all zero for an empty range
     """
+    # A zero-width range holds no liquidity (and would divide by zero below)
+    if tick_lower == tick_upper:
+        return 0, 0, 0
+    
     sqrt_price_a = tick_to_sqrt_price_x96(tick_lower)
     sqrt_price_b = tick_to_sqrt_price_x96(tick_upper)
     sqrt_price = sqrt_price_x96
@@ -212,6 +280,15 @@ def calculate_position_ratio(
     return (current_tick - tick_lower) / (tick_upper - tick_lower)
 
 
+@lru_cache(maxsize=1024)
+def checksum_address(address: str) -> str:
+    """EIP-55 checksum an address, memoized (each conversion hashes with keccak256)"""
+    # eth_utils is imported here so the CLI can import utils without it
+    from eth_utils import to_checksum_address
+    
+    return to_checksum_address(address)
+
+
 def format_eth(wei: int) -> str:
     """Format wei to ETH with 6 decimal places"""
     return f"{wei / 10**18:.6f} ETH"